@@ -1,7 +1,13 @@
 import logging
 import os
+import socket
+import sys
+import traceback
 import asyncio
-from typing import Dict, Callable, Any
+import html
+import time
+from collections import OrderedDict
+from typing import Dict, Callable, Any, List, Optional, Union
 from telegram import Update
 from telegram.ext import (
     Application, 
@@ -11,19 +17,34 @@ from telegram.ext import (
     ContextTypes
 )
 from telegram.error import TimedOut, NetworkError, RetryAfter
+from telegram.request import HTTPXRequest
 
 # Fixed SNMP imports for pysnmp-lextudio with correct function names
 from pysnmp.hlapi.v3arch.asyncio import (
-    get_cmd, next_cmd, bulk_cmd,
+    get_cmd, bulk_cmd,
     SnmpEngine, CommunityData, UdpTransportTarget, ContextData,
-    ObjectType, ObjectIdentity, Integer, OctetString, Null
+    ObjectType, ObjectIdentity, Integer, OctetString, Null,
+    is_end_of_mib
 )
 from pysnmp.proto.rfc1902 import *
-import re
+from pysnmp.proto.rfc1902 import ObjectIdentifier
+from pysnmp.proto.rfc1905 import NoSuchObject, NoSuchInstance
+from pysnmp.carrier import error as carrier_error
+from pysnmp.carrier.asyncio.dgram import udp
 
 from dotenv import load_dotenv
 load_dotenv()
 
+# Prefer uvloop's libuv-based event loop when it is installed. TelegramBot.run()
+# creates its loop through this factory; uvloop.install() is deprecated on 3.12+.
+_new_event_loop = asyncio.new_event_loop
+if sys.platform != 'win32':
+    try:
+        import uvloop
+        _new_event_loop = uvloop.new_event_loop
+    except ImportError:
+        pass
+
 # Configure logging
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -31,180 +52,349 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class SNMPManager:
- from pysnmp.hlapi.v3arch.asyncio import (
-    get_cmd, next_cmd, bulk_cmd,
-    SnmpEngine, CommunityData, UdpTransportTarget, ContextData,
-    ObjectType, ObjectIdentity
+# OIDs listed by /commonoids as (section, ((label, oid), ...)); their ObjectType
+# objects are built up front
+_COMMON_OID_SECTIONS = (
+    ("System Information", (
+        ("System description", "1.3.6.1.2.1.1.1.0"),
+        ("System uptime", "1.3.6.1.2.1.1.3.0"),
+        ("System name", "1.3.6.1.2.1.1.5.0"),
+        ("System location", "1.3.6.1.2.1.1.6.0"),
+    )),
+    ("Interface Information", (
+        ("Number of interfaces", "1.3.6.1.2.1.2.1.0"),
+        ("Interface names", "1.3.6.1.2.1.2.2.1.2"),
+        ("Interface status", "1.3.6.1.2.1.2.2.1.8"),
+        ("Interface in-octets", "1.3.6.1.2.1.2.2.1.10"),
+        ("Interface out-octets", "1.3.6.1.2.1.2.2.1.16"),
+    )),
+    ("CPU & Memory", (
+        ("CPU utilization (5min)", "1.3.6.1.4.1.9.9.109.1.1.1.1.7"),
+        ("Memory used", "1.3.6.1.4.1.9.9.48.1.1.1.5"),
+        ("Memory free", "1.3.6.1.4.1.9.9.48.1.1.1.6"),
+    )),
 )
- 
-import re
-import logging
-from typing import Dict, Any
+_COMMON_OIDS = tuple(oid for _, pairs in _COMMON_OID_SECTIONS for _, oid in pairs)
+
+class _DrainingUdpTransport(udp.UdpAsyncioTransport):
+    """UDP client transport that drains every queued datagram per readable event"""
+    
+    RECV_BATCH_SIZE = 64
+    MAX_DATAGRAM_SIZE = 65535
+    _sock = None
+    
+    def open_client_mode(self, iface=None, allow_broadcast: bool = False):
+        """Open client mode on a socket we keep a handle to for draining"""
+        if self.loop.is_closed():
+            raise carrier_error.CarrierError("Event loop is closed")
+        
+        sock = socket.socket(self.SOCK_FAMILY, socket.SOCK_DGRAM)
+        try:
+            sock.setblocking(False)
+            if allow_broadcast:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            if iface:
+                sock.bind(iface)
+            
+            self._lport = asyncio.ensure_future(
+                self.loop.create_datagram_endpoint(lambda: self, sock=sock)
+            )
+        except Exception:
+            sock.close()
+            raise carrier_error.CarrierError(
+                ";".join(traceback.format_exception(*sys.exc_info()))
+            )
+        
+        self._sock = sock
+        self._lport.add_done_callback(self._endpoint_done)
+        return self
+    
+    def _endpoint_done(self, fut: asyncio.Future):
+        """Close our socket if the endpoint was never created"""
+        if fut.cancelled() or fut.exception() is not None:
+            self._close_unowned_socket()
+    
+    def _close_unowned_socket(self):
+        """Close the socket unless an asyncio transport took ownership of it"""
+        if self._sock is not None and self.transport is None:
+            self._sock.close()
+        self._sock = None
+    
+    def close_transport(self):
+        """Close the transport, including a socket no endpoint ever adopted"""
+        self._close_unowned_socket()
+        super().close_transport()
+    
+    def datagram_received(self, datagram, transportAddress):
+        """Process the datagram, then read whatever else is already waiting"""
+        super().datagram_received(datagram, transportAddress)
+        if self._sock is None:
+            return
+        
+        # asyncio issues one recvfrom per readable event; pull the rest of the
+        # burst here instead of paying an event loop round-trip for each one
+        for _ in range(self.RECV_BATCH_SIZE - 1):
+            try:
+                datagram, transportAddress = self._sock.recvfrom(self.MAX_DATAGRAM_SIZE)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as exc:
+                self.error_received(exc)
+                break
+            super().datagram_received(datagram, transportAddress)
+
+class _DrainingUdpTransportTarget(UdpTransportTarget):
+    """UdpTransportTarget that opens a _DrainingUdpTransport"""
+    PROTO_TRANSPORT = _DrainingUdpTransport
 
 class SNMPManager:
     """SNMP Manager class for handling SNMP operations"""
     
-    def __init__(self, target_host: str = "192.168.137.130", community: str = "public", port: int = 161):
+    OID_CACHE_SIZE = 128
+    RESULT_CACHE_SIZE = 256
+    
+    def __init__(self, target_host: str = "192.168.137.130", community: str = "public", port: int = 161,
+                 cache_ttl: float = 60.0, engine: Optional[SnmpEngine] = None):
         self.target_host = target_host
         self.community = community
         self.port = port
+        self.cache_ttl = cache_ttl
+        
+        # Successful GET results keyed by OID (LRU): oid -> (monotonic timestamp, result)
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # GETs currently on the wire, so concurrent callers share one request
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Reuse one engine and transport for every query against this target. The
+        # engine may be shared with managers for earlier targets, so the owner closes it.
+        self._engine = engine or SnmpEngine()
+        self._community = CommunityData(community)
+        self._ctx = ContextData()
+        self._transport = None
+        
+        # pysnmp resolves an ObjectType against the MIB once and then reuses it,
+        # so keep recently used ones (LRU) to skip the MIB lookup on repeat queries
+        self._oid_cache: "OrderedDict[str, ObjectType]" = OrderedDict()
+        for common_oid in _COMMON_OIDS:
+            self._obj('.' + common_oid)
+        
+    def _obj(self, oid: str) -> ObjectType:
+        """Return a cached ObjectType for a normalized OID, building it if needed"""
+        obj = self._oid_cache.get(oid)
+        if obj is not None:
+            self._oid_cache.move_to_end(oid)
+            return obj
+        
+        obj = self._oid_cache[oid] = ObjectType(ObjectIdentity(oid))
+        if len(self._oid_cache) > self.OID_CACHE_SIZE:
+            self._oid_cache.popitem(last=False)
+        return obj
+        
+    async def _get_transport(self) -> UdpTransportTarget:
+        """Create the UDP transport target once and reuse it"""
+        if self._transport is None:
+            self._transport = await _DrainingUdpTransportTarget.create((self.target_host, self.port), timeout=5.0, retries=3)
+        return self._transport
         
-    def validate_oid(self, oid: str) -> bool:
-        """Validate OID format"""
-        pattern = r'^\.?(\d+\.)*\d+$'
-        return bool(re.match(pattern, oid))
+    def normalize_oid(self, oid: str) -> Optional[str]:
+        """Return the OID with a leading dot, or None if it is not a numeric dotted OID"""
+        if not oid or not oid.isascii():
+            return None
+        body = oid[1:] if oid[0] == '.' else oid
+        if not all(part.isdigit() for part in body.split('.')):
+            return None
+        return '.' + body
     
     async def get_snmp_value(self, oid: str) -> Dict[str, Any]:
-        """Get SNMP value for a given OID"""
+        """Get SNMP value for a given OID, joining an identical query already in flight"""
+        # Validate OID format and ensure it starts with a dot
+        normalized = self.normalize_oid(oid)
+        if normalized is None:
+            return {
+                "success": False,
+                "error": "Invalid OID format. OID should contain only numbers and dots (e.g., 1.3.6.1.2.1.1.1.0)"
+            }
+        
+        fut = self._inflight.get(normalized)
+        if fut is not None:
+            # Shield so a cancelled waiter does not cancel the shared query
+            return await asyncio.shield(fut)
+        
+        fut = self._inflight[normalized] = asyncio.get_running_loop().create_future()
         try:
-            # Validate OID format
-            if not self.validate_oid(oid):
-                return {
-                    "success": False,
-                    "error": "Invalid OID format. OID should contain only numbers and dots (e.g., 1.3.6.1.2.1.1.1.0)"
-                }
-            
-            # Ensure OID starts with a dot
-            if not oid.startswith('.'):
-                oid = '.' + oid
+            result = await self._fetch_snmp_value(normalized)
+            fut.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # Only the leader was cancelled; give joined callers an answer instead
+            fut.set_result({
+                "success": False,
+                "error": "SNMP query was cancelled. Please try again."
+            })
+            raise
+        finally:
+            del self._inflight[normalized]
+    
+    async def _fetch_snmp_value(self, oid: str) -> Dict[str, Any]:
+        """Query the SNMP agent for a normalized OID, serving fresh cached values first"""
+        try:
+            # Serve recently fetched values without touching the network
+            cached = self._cache.get(oid)
+            if cached is not None:
+                if time.monotonic() - cached[0] < self.cache_ttl:
+                    self._cache.move_to_end(oid)
+                    return cached[1]
+                del self._cache[oid]
             
-            # Create SNMP engine and transport target
-            snmp_engine = SnmpEngine()
-            transport_target = UdpTransportTarget.create((self.target_host, self.port), timeout=5.0, retries=3)
+            transport_target = await self._get_transport()
             
             # Perform SNMP GET operation
             cmd_generator = get_cmd(
-                snmp_engine,
-                CommunityData(self.community),
+                self._engine,
+                self._community,
                 transport_target,
-                ContextData(),
-                ObjectType(ObjectIdentity(oid))
+                self._ctx,
+                self._obj(oid)
             )
             
             # Ensure the generator is properly awaited
             try:
-                result = await cmd_generator
-                async for (errorIndication, errorStatus, errorIndex, varBinds) in result:
-                    if errorIndication:
-                        logger.error(f"SNMP error indication: {errorIndication}")
-                        return {
-                            "success": False,
-                            "error": f"SNMP Error: {errorIndication}. Check if the target device is reachable and SNMP is enabled."
-                        }
-                    elif errorStatus:
-                        logger.error(f"SNMP error status: {errorStatus.prettyPrint()} at index {errorIndex}")
-                        return {
-                            "success": False,
-                            "error": f"SNMP Error: {errorStatus.prettyPrint()} at {errorIndex and varBinds[int(errorIndex) - 1][0] or '?'}"
-                        }
-                    else:
-                        for varBind in varBinds:
-                            oid_result = varBind[0]
-                            value = varBind[1]
-                            logger.info(f"SNMP query successful for OID {oid_result}")
-                            return {
-                                "success": True,
-                                "oid": str(oid_result),
-                                "value": str(value),
-                                "type": type(value).__name__
-                            }
+                errorIndication, errorStatus, errorIndex, varBinds = await cmd_generator
+                if errorIndication:
+                    logger.error("SNMP error indication: %s", errorIndication)
+                    return {
+                        "success": False,
+                        "error": f"SNMP Error: {errorIndication}. Check if the target device is reachable and SNMP is enabled."
+                    }
+                elif errorStatus:
+                    logger.error("SNMP error status: %s at index %s", errorStatus.prettyPrint(), errorIndex)
+                    return {
+                        "success": False,
+                        "error": f"SNMP Error: {errorStatus.prettyPrint()} at {errorIndex and varBinds[int(errorIndex) - 1][0] or '?'}"
+                    }
+                
+                for varBind in varBinds:
+                    oid_result = varBind[0]
+                    value = varBind[1]
+                    logger.info("SNMP query successful for OID %s", oid_result)
+                    result = {
+                        "success": True,
+                        "oid": str(oid_result),
+                        "value": str(value),
+                        "type": type(value).__name__
+                    }
+                    # Only real values replace what is cached; a missing object may appear later
+                    if not isinstance(value, (NoSuchObject, NoSuchInstance)):
+                        self._cache[oid] = (time.monotonic(), result)
+                        self._cache.move_to_end(oid)
+                        if len(self._cache) > self.RESULT_CACHE_SIZE:
+                            self._cache.popitem(last=False)
+                    return result
             except AttributeError as ae:
-                logger.error(f"SNMP AttributeError: {ae}")
+                logger.error("SNMP AttributeError: %s", ae)
                 return {
                     "success": False,
                     "error": f"SNMP AttributeError: {str(ae)}. Ensure the correct pysnmp version is installed."
                 }
             
-            logger.warning(f"No data received for OID {oid}")
+            logger.warning("No data received for OID %s", oid)
             return {
                 "success": False,
                 "error": "No data received from SNMP query. Verify the OID and target configuration."
             }
             
         except TimeoutError as e:
-            logger.error(f"SNMP timeout error: {e}")
+            logger.error("SNMP timeout error: %s", e)
             return {
                 "success": False,
                 "error": "SNMP request timed out. Check if the target device is reachable or increase timeout."
             }
         except Exception as e:
-            logger.error(f"SNMP Error: {e}", exc_info=True)
+            logger.error("SNMP Error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {
                 "success": False,
                 "error": f"Connection error: {str(e)}. Ensure the SNMP target is configured correctly."
             }
 
+    async def _get_one(self, sem: asyncio.Semaphore, oid: str) -> Dict[str, Any]:
+        """Get a single OID while holding a concurrency slot"""
+        async with sem:
+            return await self.get_snmp_value(oid)
+    
+    async def get_many(self, oids: List[str], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Get several OIDs concurrently, returning results in request order"""
+        sem = asyncio.Semaphore(concurrency)
+        tasks = [asyncio.create_task(self._get_one(sem, oid)) for oid in oids]
+        return await asyncio.gather(*tasks)
+    
     async def walk_snmp_tree(self, oid: str, max_results: int = 10) -> Dict[str, Any]:
         """Walk SNMP tree starting from given OID"""
         try:
-            if not self.validate_oid(oid):
+            # Validate OID format and ensure it starts with a dot
+            normalized = self.normalize_oid(oid)
+            if normalized is None:
                 return {
                     "success": False,
                     "error": "Invalid OID format"
                 }
-            
-            # Ensure OID starts with a dot
-            if not oid.startswith('.'):
-                oid = '.' + oid
+            oid = normalized
             
             results = []
             count = 0
             
-            # Create SNMP engine and transport target
-            snmp_engine = SnmpEngine()
-            transport_target = UdpTransportTarget.create((self.target_host, self.port), timeout=5.0, retries=3)
+            transport_target = await self._get_transport()
             
-            # Use next_cmd for SNMP walk
-            cmd_generator = next_cmd(
-                snmp_engine,
-                CommunityData(self.community),
+            # Use bulk_cmd (GETBULK) so the whole walk fits in a single round-trip
+            cmd_generator = bulk_cmd(
+                self._engine,
+                self._community,
                 transport_target,
-                ContextData(),
-                ObjectType(ObjectIdentity(oid)),
-                lexicographicMode=False
+                self._ctx,
+                0, max_results,
+                self._obj(oid)
             )
+            root = ObjectIdentifier(oid.lstrip('.'))
             
             # Ensure the generator is properly awaited
             try:
-                result = await cmd_generator
-                async for (errorIndication, errorStatus, errorIndex, varBinds) in result:
-                    if errorIndication:
-                        logger.error(f"SNMP walk error indication: {errorIndication}")
-                        return {
-                            "success": False,
-                            "error": f"SNMP surging: {errorIndication}. Check if the target device is reachable and SNMP is enabled."
-                        }
-                    elif errorStatus:
-                        logger.error(f"SNMP walk error status: {errorStatus.prettyPrint()}")
-                        return {
-                            "success": False,
-                            "error": f"SNMP Error: {errorStatus.prettyPrint()}"
-                        }
-                    else:
-                        for varBind in varBinds:
-                            oid_result = str(varBind[0])
-                            value = str(varBind[1])
-                            logger.info(f"SNMP walk result: OID {oid_result}, Value {value}")
-                            results.append({
-                                "oid": oid_result,
-                                "value": value
-                            })
-                            
-                            count += 1
-                            if count >= max_results:
-                                break
-                        
-                        if count >= max_results:
-                            break
+                errorIndication, errorStatus, errorIndex, varBinds = await cmd_generator
+                if errorIndication:
+                    logger.error("SNMP walk error indication: %s", errorIndication)
+                    return {
+                        "success": False,
+                        "error": f"SNMP surging: {errorIndication}. Check if the target device is reachable and SNMP is enabled."
+                    }
+                elif errorStatus:
+                    logger.error("SNMP walk error status: %s", errorStatus.prettyPrint())
+                    return {
+                        "success": False,
+                        "error": f"SNMP Error: {errorStatus.prettyPrint()}"
+                    }
+                
+                for varBind in varBinds:
+                    # GETBULK does not stop at the subtree boundary on its own
+                    if is_end_of_mib([varBind]) or not root.isPrefixOf(varBind[0].get_oid()):
+                        break
+                    
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("SNMP walk result: OID %s, Value %s", varBind[0], varBind[1])
+                    # Keep the raw pysnmp objects; they are only stringified when rendered
+                    results.append({
+                        "oid": varBind[0],
+                        "value": varBind[1]
+                    })
+                    
+                    count += 1
+                    if count >= max_results:
+                        break
             except AttributeError as ae:
-                logger.error(f"SNMP AttributeError: {ae}")
+                logger.error("SNMP AttributeError: %s", ae)
                 return {
                     "success": False,
                     "error": f"SNMP AttributeError: {str(ae)}. Ensure the correct pysnmp version is installed."
                 }
             
-            logger.info(f"SNMP walk completed with {count} results")
+            logger.info("SNMP walk completed with %s results", count)
             return {
                 "success": True,
                 "results": results,
@@ -212,39 +402,120 @@ class SNMPManager:
             }
             
         except TimeoutError as e:
-            logger.error(f"SNMP walk timeout error: {e}")
+            logger.error("SNMP walk timeout error: %s", e)
             return {
                 "success": False,
                 "error": "SNMP walk timed out. Check if the target device is reachable or increase timeout."
             }
         except Exception as e:
-            logger.error(f"SNMP Walk Error: {e}", exc_info=True)
+            logger.error("SNMP Walk Error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {
                 "success": False,
                 "error": f"Connection error: {str(e)}. Ensure the SNMP target is configured correctly."
             }
 
+# Static reply texts, built once at import
+_WELCOME_FMT = (
+    "Hello {name}! 👋\n\n"
+    "I'm your SNMP monitoring bot. Here are available commands:\n\n"
+    "📊 <b>SNMP Commands:</b>\n"
+    "/snmp &lt;OID&gt; - Get SNMP value for specific OID\n"
+    "/snmpwalk &lt;OID&gt; - Walk SNMP tree from OID\n"
+    "/snmpmulti &lt;OID&gt; [OID ...] - Get several OIDs at once\n"
+    "/snmpconfig &lt;host&gt; [community] [port] - Configure SNMP settings\n"
+    "/snmpstatus - Show current SNMP configuration\n"
+    "/commonoids - Show common Cisco OIDs\n\n"
+    "🔧 <b>General Commands:</b>\n"
+    "/start - Show this welcome message\n"
+    "/help - Get detailed help information\n"
+    "/echo &lt;message&gt; - Echo your message\n"
+    "/info - Get your user information\n\n"
+    "💡 <b>Examples:</b>\n"
+    "<code>/snmp 1.3.6.1.2.1.1.1.0</code> - Get system description\n"
+    "<code>/snmpconfig 192.168.1.1 public 161</code> - Set SNMP target"
+)
+
+_HELP_TEXT = (
+    "🤖 <b>SNMP Monitoring Bot Help</b>\n\n"
+    "<b>SNMP Commands:</b>\n"
+    "• <code>/snmp &lt;OID&gt;</code> - Query specific SNMP OID\n"
+    "  Example: <code>/snmp 1.3.6.1.2.1.1.1.0</code>\n\n"
+    "• <code>/snmpwalk &lt;OID&gt;</code> - Walk SNMP tree (max 10 results)\n"
+    "  Example: <code>/snmpwalk 1.3.6.1.2.1.2.2.1.2</code>\n\n"
+    "• <code>/snmpmulti &lt;OID&gt; [OID ...]</code> - Query several OIDs at once (max 10)\n"
+    "  Example: <code>/snmpmulti 1.3.6.1.2.1.1.1.0 1.3.6.1.2.1.1.5.0</code>\n\n"
+    "• <code>/snmpconfig &lt;host&gt; [community] [port]</code> - Configure SNMP\n"
+    "  Example: <code>/snmpconfig 192.168.1.1 public 161</code>\n\n"
+    "• <code>/snmpstatus</code> - Show current configuration\n"
+    "• <code>/commonoids</code> - Show common Cisco OIDs\n\n"
+    "<b>General Commands:</b>\n"
+    "• <code>/start</code> - Welcome message\n"
+    "• <code>/help</code> - This help message\n"
+    "• <code>/echo &lt;text&gt;</code> - Echo your text\n"
+    "• <code>/info</code> - Your user information\n\n"
+    "<b>OID Format:</b>\n"
+    "OIDs should be in format: <code>1.3.6.1.2.1.1.1.0</code>\n"
+    "Leading dot is optional.\n\n"
+    "<b>Note:</b> Make sure your SNMP target is reachable and configured properly!"
+)
+
+def _render_common_oids(sections) -> str:
+    """Render the /commonoids reply from (section, pairs) tuples"""
+    parts = ["📋 <b>Common Cisco SNMP OIDs</b>\n\n"]
+    for title, pairs in sections:
+        parts.append(f"<b>{html.escape(title)}:</b>\n")
+        parts.extend(f"• <code>{oid}</code> - {html.escape(label)}\n" for label, oid in pairs)
+        parts.append("\n")
+    parts.append(
+        "<b>Examples:</b>\n"
+        "<code>/snmp 1.3.6.1.2.1.1.1.0</code>\n"
+        "<code>/snmpwalk 1.3.6.1.2.1.2.2.1.2</code>"
+    )
+    return "".join(parts)
+
+_COMMON_OIDS_TEXT = _render_common_oids(_COMMON_OID_SECTIONS)
+
 class TelegramBot:
-    def __init__(self, token: str):
+    def __init__(self, token: str, connection_pool_size: int = 32, get_updates_pool_size: int = 4,
+                 snmp_workers: int = 8, snmp_queue_size: int = 100, snmp_cache_ttl: float = 60.0):
         self.token = token
+        self.connection_pool_size = connection_pool_size
+        self.get_updates_pool_size = get_updates_pool_size
+        self.snmp_workers = snmp_workers
+        self.snmp_queue_size = snmp_queue_size
+        self.snmp_cache_ttl = snmp_cache_ttl
         self.application = None
         self.commands: Dict[str, Callable] = {}
-        self.snmp_manager = SNMPManager()
+        # One SNMP engine for the bot's lifetime; closing it while requests are pending
+        # would stop their timeouts, so config changes only swap the manager
+        self._snmp_engine = SnmpEngine()
+        self.snmp_manager = SNMPManager(cache_ttl=snmp_cache_ttl, engine=self._snmp_engine)
         self.is_running = False
+        self._stop_event = None
+        self._snmp_queue = None
+        self._workers = []
         
     def _build_application(self):
         """Build the application with proper configuration"""
         # Use the new ApplicationBuilder approach with proper timeout settings
         builder = Application.builder().token(self.token)
         
-        # Configure timeouts using the new method
-        builder = builder.get_updates_read_timeout(30)
-        builder = builder.get_updates_write_timeout(30)
-        builder = builder.get_updates_connect_timeout(30)
-        builder = builder.get_updates_pool_timeout(30)
-        
-        # Set connection pool timeout
-        builder = builder.connection_pool_size(8)
+        # HTTP/2 lets concurrent API calls share one keep-alive connection instead of
+        # queueing for sockets. Long polling keeps its own small pool so outbound
+        # replies never wait on it.
+        builder = builder.request(HTTPXRequest(
+            connection_pool_size=self.connection_pool_size,
+            pool_timeout=10,
+            http_version="2",
+        ))
+        builder = builder.get_updates_request(HTTPXRequest(
+            connection_pool_size=self.get_updates_pool_size,
+            read_timeout=30,
+            write_timeout=30,
+            connect_timeout=30,
+            pool_timeout=30,
+            http_version="2",
+        ))
         
         return builder.build()
     
@@ -269,38 +540,116 @@ class TelegramBot:
             
         self.commands[command] = handler
         self.application.add_handler(CommandHandler(command, handler))
-        logger.info(f"Registered command: /{command}")
+        logger.info("Registered command: /%s", command)
     
     def update_snmp_config(self, host: str, community: str = "public", port: int = 161):
         """Update SNMP configuration"""
-        self.snmp_manager = SNMPManager(host, community, port)
-        logger.info(f"Updated SNMP config: {host}:{port} with community '{community}'")
+        self.snmp_manager = SNMPManager(host, community, port, self.snmp_cache_ttl, engine=self._snmp_engine)
+        logger.info("Updated SNMP config: %s:%s with community '%s'", host, port, community)
     
     async def _error_handler(self, update: object, context: ContextTypes.DEFAULT_TYPE):
         """Handle errors with better error handling"""
         error = context.error
         
         if isinstance(error, TimedOut):
-            logger.warning(f"Request timed out: {error}")
+            logger.warning("Request timed out: %s", error)
             return
         elif isinstance(error, NetworkError):
-            logger.warning(f"Network error: {error}")
+            logger.warning("Network error: %s", error)
             # Don't sleep in error handler, just log
             return
         elif isinstance(error, RetryAfter):
-            logger.warning(f"Rate limited. Retry after {error.retry_after} seconds")
+            logger.warning("Rate limited. Retry after %s seconds", error.retry_after)
             return
         else:
-            logger.error(f"Update {update} caused error {error}", exc_info=True)
+            logger.error("Update %s caused error %s", update, error, exc_info=True)
     
     async def _handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle regular messages (non-commands)"""
         try:
             user_message = update.message.text
             chat_id = update.effective_chat.id
-            logger.info(f"Received message from {chat_id}: {user_message}")
+            logger.info("Received message from %s: %s", chat_id, user_message)
         except Exception as e:
-            logger.error(f"Error handling message: {e}")
+            logger.error("Error handling message: %s", e)
+    
+    def submit_snmp_job(self, command: str, oid: Union[str, List[str]], chat_id: int, message_id: int) -> bool:
+        """Queue an SNMP 'get', 'walk' or 'multi' (list of OIDs) whose result will replace the given message"""
+        try:
+            self._snmp_queue.put_nowait((command, oid, chat_id, message_id))
+            return True
+        except asyncio.QueueFull:
+            return False
+    
+    async def _snmp_worker(self):
+        """Run queued SNMP jobs and edit the placeholder message with the result"""
+        while True:
+            command, oid, chat_id, message_id = await self._snmp_queue.get()
+            try:
+                if command == 'walk':
+                    result = await self.snmp_manager.walk_snmp_tree(oid)
+                    response = self._format_walk_result(result)
+                elif command == 'multi':
+                    results = await self.snmp_manager.get_many(oid)
+                    response = self._format_multi_result(oid, results)
+                else:
+                    result = await self.snmp_manager.get_snmp_value(oid)
+                    response = self._format_get_result(result)
+                
+                await self.application.bot.edit_message_text(
+                    response, chat_id=chat_id, message_id=message_id, parse_mode='HTML'
+                )
+            except Exception as e:
+                logger.error("Error in SNMP worker for OID %s: %s", oid, e)
+                # Don't leave the "Please wait" placeholder behind
+                try:
+                    await self.application.bot.edit_message_text(
+                        "❌ An error occurred while processing your request.",
+                        chat_id=chat_id, message_id=message_id
+                    )
+                except Exception as edit_error:
+                    logger.error("Error reporting SNMP worker failure: %s", edit_error)
+            finally:
+                self._snmp_queue.task_done()
+    
+    def _format_get_result(self, result: Dict[str, Any]) -> str:
+        """Format an SNMP GET result as a reply message"""
+        if result["success"]:
+            return (
+                f"✅ <b>SNMP Query Successful</b>\n\n"
+                f"<b>OID:</b> <code>{html.escape(result['oid'])}</code>\n"
+                f"<b>Value:</b> <code>{html.escape(result['value'])}</code>\n"
+                f"<b>Type:</b> {result['type']}\n"
+                f"<b>Target:</b> {html.escape(self.snmp_manager.target_host)}"
+            )
+        return f"❌ <b>SNMP Query Failed</b>\n\n<b>Error:</b> {html.escape(result['error'])}"
+    
+    def _format_walk_result(self, result: Dict[str, Any]) -> str:
+        """Format an SNMP walk result as a reply message"""
+        if not result["success"]:
+            return f"❌ <b>SNMP Walk Failed</b>\n\n<b>Error:</b> {html.escape(result['error'])}"
+        if not result["results"]:
+            return "📭 No results found for the specified OID."
+        
+        header = f"✅ <b>SNMP Walk Results</b> (Showing {result['count']} results)\n\n"
+        body = "\n".join(
+            f"<b>OID:</b> <code>{html.escape(str(item['oid']))}</code>\n<b>Value:</b> <code>{html.escape(str(item['value']))}</code>\n"
+            for item in result["results"]
+        )
+        footer = f"\n<b>Target:</b> {html.escape(self.snmp_manager.target_host)}"
+        return "".join([header, body, footer])
+    
+    def _format_multi_result(self, oids: List[str], results: List[Dict[str, Any]]) -> str:
+        """Format SNMP multi-get results as a reply message"""
+        header = f"📊 <b>SNMP Multi-Get Results</b> ({len(oids)} OIDs)\n\n"
+        body = "\n".join(
+            f"<b>OID:</b> <code>{html.escape(result['oid'])}</code>\n<b>Value:</b> <code>{html.escape(result['value'])}</code>\n"
+            if result["success"] else
+            f"<b>OID:</b> <code>{html.escape(oid)}</code>\n<b>Error:</b> {html.escape(result['error'])}\n"
+            for oid, result in zip(oids, results)
+        )
+        footer = f"\n<b>Target:</b> {html.escape(self.snmp_manager.target_host)}"
+        return "".join([header, body, footer])
     
     async def start_bot(self):
         """Start the bot asynchronously"""
@@ -309,6 +658,11 @@ class TelegramBot:
                 self.application = self._build_application()
                 self._setup_handlers()
             
+            # Created here so it binds to the running event loop
+            self._stop_event = asyncio.Event()
+            self._snmp_queue = asyncio.Queue(maxsize=self.snmp_queue_size)
+            self._workers = [asyncio.create_task(self._snmp_worker()) for _ in range(self.snmp_workers)]
+            
             logger.info("Initializing bot...")
             await self.application.initialize()
             
@@ -324,7 +678,7 @@ class TelegramBot:
             logger.info("Bot is running. Press Ctrl+C to stop.")
             
         except Exception as e:
-            logger.error(f"Error starting bot: {e}")
+            logger.error("Error starting bot: %s", e)
             raise
     
     async def stop_bot(self):
@@ -333,6 +687,13 @@ class TelegramBot:
             if self.application and self.is_running:
                 logger.info("Stopping bot...")
                 self.is_running = False
+                self._stop_event.set()
+                
+                for worker in self._workers:
+                    worker.cancel()
+                await asyncio.gather(*self._workers, return_exceptions=True)
+                self._workers = []
+                self._snmp_engine.close_dispatcher()
                 
                 await self.application.updater.stop()
                 await self.application.stop()
@@ -340,98 +701,70 @@ class TelegramBot:
                 
                 logger.info("Bot stopped successfully")
         except Exception as e:
-            logger.error(f"Error stopping bot: {e}")
+            logger.error("Error stopping bot: %s", e)
     
     def run(self):
         """Run the bot with proper event loop handling"""
         async def run_bot():
             try:
                 await self.start_bot()
-                # Keep the bot running
-                while self.is_running:
-                    await asyncio.sleep(1)
+                # Keep the bot running until stop_bot() is called
+                await self._stop_event.wait()
             except KeyboardInterrupt:
                 logger.info("Bot stopped by user")
             except Exception as e:
-                logger.error(f"Bot error: {e}", exc_info=True)
+                logger.error("Bot error: %s", e, exc_info=True)
             finally:
                 await self.stop_bot()
         
         # Handle event loop properly
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an event loop, create a task
-                task = loop.create_task(run_bot())
-                return task
-            else:
-                # If no event loop is running, run until complete
-                loop.run_until_complete(run_bot())
+            loop = asyncio.get_running_loop()
         except RuntimeError:
-            # If no event loop exists, create a new one
-            asyncio.run(run_bot())
-
-class CommandHandlers:
-    @staticmethod
-    async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            # If no event loop is running, create one and run until complete
+            loop = _new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(run_bot())
+            finally:
+                loop.close()
+        else:
+            # If we're already in an event loop, create a task
+            return loop.create_task(run_bot())
+    
+    def register_default_commands(self):
+        """Register the built-in general and SNMP commands"""
+        self.register_command('start', self._cmd_start)
+        self.register_command('help', self._cmd_help)
+        self.register_command('echo', self._cmd_echo)
+        self.register_command('info', self._cmd_info)
+        
+        # SNMP commands
+        self.register_command('snmp', self._cmd_snmp_get)
+        self.register_command('snmpwalk', self._cmd_snmp_walk)
+        self.register_command('snmpmulti', self._cmd_snmp_multi)
+        self.register_command('snmpconfig', self._cmd_snmp_config)
+        self.register_command('snmpstatus', self._cmd_snmp_status)
+        self.register_command('commonoids', self._cmd_common_oids)
+    
+    async def _cmd_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
         try:
             user = update.effective_user
-            welcome_message = (
-                f"Hello {user.first_name}! 👋\n\n"
-                "I'm your SNMP monitoring bot. Here are available commands:\n\n"
-                "📊 **SNMP Commands:**\n"
-                "/snmp <OID> - Get SNMP value for specific OID\n"
-                "/snmpwalk <OID> - Walk SNMP tree from OID\n"
-                "/snmpconfig <host> [community] [port] - Configure SNMP settings\n"
-                "/snmpstatus - Show current SNMP configuration\n"
-                "/commonoids - Show common Cisco OIDs\n\n"
-                "🔧 **General Commands:**\n"
-                "/start - Show this welcome message\n"
-                "/help - Get detailed help information\n"
-                "/echo <message> - Echo your message\n"
-                "/info - Get your user information\n\n"
-                "💡 **Examples:**\n"
-                "`/snmp 1.3.6.1.2.1.1.1.0` - Get system description\n"
-                "`/snmpconfig 192.168.1.1 public 161` - Set SNMP target"
-            )
-            await update.message.reply_text(welcome_message, parse_mode='Markdown')
-            logger.info(f"Sent welcome message to {user.first_name} (ID: {user.id})")
+            await update.message.reply_text(_WELCOME_FMT.format(name=html.escape(user.first_name)), parse_mode='HTML')
+            logger.info("Sent welcome message to %s (ID: %s)", user.first_name, user.id)
         except Exception as e:
-            logger.error(f"Error in start command: {e}")
+            logger.error("Error in start command: %s", e)
     
-    @staticmethod
-    async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
         try:
-            help_text = (
-                "🤖 **SNMP Monitoring Bot Help**\n\n"
-                "**SNMP Commands:**\n"
-                "• `/snmp <OID>` - Query specific SNMP OID\n"
-                "  Example: `/snmp 1.3.6.1.2.1.1.1.0`\n\n"
-                "• `/snmpwalk <OID>` - Walk SNMP tree (max 10 results)\n"
-                "  Example: `/snmpwalk 1.3.6.1.2.1.2.2.1.2`\n\n"
-                "• `/snmpconfig <host> [community] [port]` - Configure SNMP\n"
-                "  Example: `/snmpconfig 192.168.1.1 public 161`\n\n"
-                "• `/snmpstatus` - Show current configuration\n"
-                "• `/commonoids` - Show common Cisco OIDs\n\n"
-                "**General Commands:**\n"
-                "• `/start` - Welcome message\n"
-                "• `/help` - This help message\n"
-                "• `/echo <text>` - Echo your text\n"
-                "• `/info` - Your user information\n\n"
-                "**OID Format:**\n"
-                "OIDs should be in format: `1.3.6.1.2.1.1.1.0`\n"
-                "Leading dot is optional.\n\n"
-                "**Note:** Make sure your SNMP target is reachable and configured properly!"
-            )
-            await update.message.reply_text(help_text, parse_mode='Markdown')
-            logger.info(f"Sent help message to user ID: {update.effective_user.id}")
+            await update.message.reply_text(_HELP_TEXT, parse_mode='HTML')
+            logger.info("Sent help message to user ID: %s", update.effective_user.id)
         except Exception as e:
-            logger.error(f"Error in help command: {e}")
+            logger.error("Error in help command: %s", e)
     
-    @staticmethod
-    async def echo(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _cmd_echo(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /echo command"""
         try:
             if context.args:
@@ -439,224 +772,185 @@ class CommandHandlers:
                 await update.message.reply_text(f"🔄 Echo: {echo_text}")
             else:
                 await update.message.reply_text("Please provide text to echo. Usage: /echo <your message>")
-            logger.info(f"Echo command used by user ID: {update.effective_user.id}")
+            logger.info("Echo command used by user ID: %s", update.effective_user.id)
         except Exception as e:
-            logger.error(f"Error in echo command: {e}")
+            logger.error("Error in echo command: %s", e)
     
-    @staticmethod
-    async def info(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _cmd_info(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /info command"""
         try:
             user = update.effective_user
             chat = update.effective_chat
             
             info_text = (
-                f"👤 **User Information:**\n"
-                f"Name: {user.first_name} {user.last_name or ''}\n"
-                f"Username: @{user.username or 'None'}\n"
+                f"👤 <b>User Information:</b>\n"
+                f"Name: {html.escape(user.first_name)} {html.escape(user.last_name or '')}\n"
+                f"Username: @{html.escape(user.username or 'None')}\n"
                 f"User ID: {user.id}\n"
                 f"Chat ID: {chat.id}\n"
                 f"Chat Type: {chat.type}"
             )
-            await update.message.reply_text(info_text, parse_mode='Markdown')
-            logger.info(f"Info command used by user ID: {user.id}")
+            await update.message.reply_text(info_text, parse_mode='HTML')
+            logger.info("Info command used by user ID: %s", user.id)
         except Exception as e:
-            logger.error(f"Error in info command: {e}")
+            logger.error("Error in info command: %s", e)
     
-    @staticmethod
-    async def snmp_get(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _cmd_snmp_get(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /snmp command - Get SNMP value for specific OID"""
         try:
             if not context.args:
                 help_text = (
-                    "📊 **SNMP Get Command**\n\n"
-                    "Usage: `/snmp <OID>`\n\n"
-                    "**Examples:**\n"
-                    "• `/snmp 1.3.6.1.2.1.1.1.0` - System description\n"
-                    "• `/snmp 1.3.6.1.2.1.1.3.0` - System uptime\n"
-                    "• `/snmp 1.3.6.1.2.1.1.5.0` - System name\n\n"
-                    "Use `/commonoids` to see more common OIDs."
+                    "📊 <b>SNMP Get Command</b>\n\n"
+                    "Usage: <code>/snmp &lt;OID&gt;</code>\n\n"
+                    "<b>Examples:</b>\n"
+                    "• <code>/snmp 1.3.6.1.2.1.1.1.0</code> - System description\n"
+                    "• <code>/snmp 1.3.6.1.2.1.1.3.0</code> - System uptime\n"
+                    "• <code>/snmp 1.3.6.1.2.1.1.5.0</code> - System name\n\n"
+                    "Use <code>/commonoids</code> to see more common OIDs."
                 )
-                await update.message.reply_text(help_text, parse_mode='Markdown')
+                await update.message.reply_text(help_text, parse_mode='HTML')
                 return
             
             oid = context.args[0]
-            await update.message.reply_text("🔄 Querying SNMP... Please wait.")
+            message = await update.message.reply_text("🔄 Querying SNMP... Please wait.")
             
-            # Get bot instance and perform SNMP query
-            bot = context.bot_data.get('bot_instance')
-            if not bot:
-                await update.message.reply_text("❌ Bot instance not found. Please restart the bot.")
+            # Queue the SNMP query; a worker edits the message with the result
+            if not self.submit_snmp_job('get', oid, message.chat_id, message.message_id):
+                await message.edit_text("⏳ Too many SNMP requests in progress. Please try again shortly.")
                 return
             
-            result = await bot.snmp_manager.get_snmp_value(oid)
-            
-            if result["success"]:
-                response = (
-                    f"✅ **SNMP Query Successful**\n\n"
-                    f"**OID:** `{result['oid']}`\n"
-                    f"**Value:** `{result['value']}`\n"
-                    f"**Type:** {result['type']}\n"
-                    f"**Target:** {bot.snmp_manager.target_host}"
-                )
-            else:
-                response = f"❌ **SNMP Query Failed**\n\n**Error:** {result['error']}"
-            
-            await update.message.reply_text(response, parse_mode='Markdown')
-            logger.info(f"SNMP query for OID {oid} by user {update.effective_user.id}")
+            logger.info("SNMP query for OID %s by user %s", oid, update.effective_user.id)
             
         except Exception as e:
-            logger.error(f"Error in snmp_get command: {e}")
+            logger.error("Error in snmp_get command: %s", e)
             await update.message.reply_text("❌ An error occurred while processing your request.")
     
-    @staticmethod
-    async def snmp_walk(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _cmd_snmp_walk(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /snmpwalk command - Walk SNMP tree from OID"""
         try:
             if not context.args:
                 help_text = (
-                    "🚶 **SNMP Walk Command**\n\n"
-                    "Usage: `/snmpwalk <OID>`\n\n"
-                    "**Examples:**\n"
-                    "• `/snmpwalk 1.3.6.1.2.1.2.2.1.2` - Interface names\n"
-                    "• `/snmpwalk 1.3.6.1.2.1.2.2.1.10` - Interface in-octets\n"
-                    "• `/snmpwalk 1.3.6.1.2.1.1` - System info tree\n\n"
-                    "**Note:** Limited to 10 results to prevent spam."
+                    "🚶 <b>SNMP Walk Command</b>\n\n"
+                    "Usage: <code>/snmpwalk &lt;OID&gt;</code>\n\n"
+                    "<b>Examples:</b>\n"
+                    "• <code>/snmpwalk 1.3.6.1.2.1.2.2.1.2</code> - Interface names\n"
+                    "• <code>/snmpwalk 1.3.6.1.2.1.2.2.1.10</code> - Interface in-octets\n"
+                    "• <code>/snmpwalk 1.3.6.1.2.1.1</code> - System info tree\n\n"
+                    "<b>Note:</b> Limited to 10 results to prevent spam."
                 )
-                await update.message.reply_text(help_text, parse_mode='Markdown')
+                await update.message.reply_text(help_text, parse_mode='HTML')
                 return
             
             oid = context.args[0]
-            await update.message.reply_text("🔄 Walking SNMP tree... Please wait.")
+            message = await update.message.reply_text("🔄 Walking SNMP tree... Please wait.")
             
-            # Get bot instance and perform SNMP walk
-            bot = context.bot_data.get('bot_instance')
-            if not bot:
-                await update.message.reply_text("❌ Bot instance not found. Please restart the bot.")
+            # Queue the SNMP walk; a worker edits the message with the result
+            if not self.submit_snmp_job('walk', oid, message.chat_id, message.message_id):
+                await message.edit_text("⏳ Too many SNMP requests in progress. Please try again shortly.")
                 return
             
-            result = await bot.snmp_manager.walk_snmp_tree(oid)
+            logger.info("SNMP walk for OID %s by user %s", oid, update.effective_user.id)
             
-            if result["success"]:
-                if result["results"]:
-                    response = f"✅ **SNMP Walk Results** (Showing {result['count']} results)\n\n"
-                    for item in result["results"]:
-                        response += f"**OID:** `{item['oid']}`\n**Value:** `{item['value']}`\n\n"
-                    response += f"**Target:** {bot.snmp_manager.target_host}"
-                else:
-                    response = "📭 No results found for the specified OID."
-            else:
-                response = f"❌ **SNMP Walk Failed**\n\n**Error:** {result['error']}"
+        except Exception as e:
+            logger.error("Error in snmp_walk command: %s", e)
+            await update.message.reply_text("❌ An error occurred while processing your request.")
+    
+    async def _cmd_snmp_multi(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /snmpmulti command - Get SNMP values for several OIDs"""
+        try:
+            if not context.args:
+                help_text = (
+                    "📊 <b>SNMP Multi-Get Command</b>\n\n"
+                    "Usage: <code>/snmpmulti &lt;OID&gt; [OID ...]</code>\n\n"
+                    "<b>Example:</b>\n"
+                    "• <code>/snmpmulti 1.3.6.1.2.1.1.1.0 1.3.6.1.2.1.1.3.0 1.3.6.1.2.1.1.5.0</code>\n\n"
+                    "<b>Note:</b> Limited to 10 OIDs per request."
+                )
+                await update.message.reply_text(help_text, parse_mode='HTML')
+                return
             
-            await update.message.reply_text(response, parse_mode='Markdown')
-            logger.info(f"SNMP walk for OID {oid} by user {update.effective_user.id}")
+            oids = context.args[:10]
+            message = await update.message.reply_text("🔄 Querying SNMP... Please wait.")
+            
+            # Queue the SNMP queries; a worker runs them concurrently and edits the message
+            if not self.submit_snmp_job('multi', oids, message.chat_id, message.message_id):
+                await message.edit_text("⏳ Too many SNMP requests in progress. Please try again shortly.")
+                return
+            
+            logger.info("SNMP multi-get for %s OIDs by user %s", len(oids), update.effective_user.id)
             
         except Exception as e:
-            logger.error(f"Error in snmp_walk command: {e}")
+            logger.error("Error in snmp_multi command: %s", e)
             await update.message.reply_text("❌ An error occurred while processing your request.")
     
-    @staticmethod
-    async def snmp_config(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _cmd_snmp_config(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /snmpconfig command - Configure SNMP settings"""
         try:
             if not context.args:
                 help_text = (
-                    "⚙️ **SNMP Configuration**\n\n"
-                    "Usage: `/snmpconfig <host> [community] [port]`\n\n"
-                    "**Parameters:**\n"
-                    "• `host` - SNMP target IP address (required)\n"
-                    "• `community` - SNMP community string (default: public)\n"
-                    "• `port` - SNMP port (default: 161)\n\n"
-                    "**Examples:**\n"
-                    "• `/snmpconfig 192.168.1.1`\n"
-                    "• `/snmpconfig 192.168.1.1 public`\n"
-                    "• `/snmpconfig 192.168.1.1 private 161`\n\n"
-                    "Use `/snmpstatus` to view current configuration."
+                    "⚙️ <b>SNMP Configuration</b>\n\n"
+                    "Usage: <code>/snmpconfig &lt;host&gt; [community] [port]</code>\n\n"
+                    "<b>Parameters:</b>\n"
+                    "• <code>host</code> - SNMP target IP address (required)\n"
+                    "• <code>community</code> - SNMP community string (default: public)\n"
+                    "• <code>port</code> - SNMP port (default: 161)\n\n"
+                    "<b>Examples:</b>\n"
+                    "• <code>/snmpconfig 192.168.1.1</code>\n"
+                    "• <code>/snmpconfig 192.168.1.1 public</code>\n"
+                    "• <code>/snmpconfig 192.168.1.1 private 161</code>\n\n"
+                    "Use <code>/snmpstatus</code> to view current configuration."
                 )
-                await update.message.reply_text(help_text, parse_mode='Markdown')
+                await update.message.reply_text(help_text, parse_mode='HTML')
                 return
             
             host = context.args[0]
             community = context.args[1] if len(context.args) > 1 else "public"
             port = int(context.args[2]) if len(context.args) > 2 else 161
             
-            # Get bot instance and update configuration
-            bot = context.bot_data.get('bot_instance')
-            if not bot:
-                await update.message.reply_text("❌ Bot instance not found. Please restart the bot.")
-                return
-            
-            bot.update_snmp_config(host, community, port)
+            # Update configuration
+            self.update_snmp_config(host, community, port)
             
             response = (
-                f"✅ **SNMP Configuration Updated**\n\n"
-                f"**Host:** {host}\n"
-                f"**Community:** {community}\n"
-                f"**Port:** {port}\n\n"
-                f"You can now use `/snmp` and `/snmpwalk` commands with this configuration."
+                f"✅ <b>SNMP Configuration Updated</b>\n\n"
+                f"<b>Host:</b> {html.escape(host)}\n"
+                f"<b>Community:</b> {html.escape(community)}\n"
+                f"<b>Port:</b> {port}\n\n"
+                f"You can now use <code>/snmp</code> and <code>/snmpwalk</code> commands with this configuration."
             )
-            await update.message.reply_text(response, parse_mode='Markdown')
-            logger.info(f"SNMP config updated by user {update.effective_user.id}: {host}:{port}")
+            await update.message.reply_text(response, parse_mode='HTML')
+            logger.info("SNMP config updated by user %s: %s:%s", update.effective_user.id, host, port)
             
         except ValueError:
             await update.message.reply_text("❌ Invalid port number. Port must be a number.")
         except Exception as e:
-            logger.error(f"Error in snmp_config command: {e}")
+            logger.error("Error in snmp_config command: %s", e)
             await update.message.reply_text("❌ An error occurred while updating configuration.")
     
-    @staticmethod
-    async def snmp_status(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _cmd_snmp_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /snmpstatus command - Show current SNMP configuration"""
         try:
-            bot = context.bot_data.get('bot_instance')
-            if not bot:
-                await update.message.reply_text("❌ Bot instance not found. Please restart the bot.")
-                return
-            
             response = (
-                f"📊 **Current SNMP Configuration**\n\n"
-                f"**Host:** {bot.snmp_manager.target_host}\n"
-                f"**Community:** {bot.snmp_manager.community}\n"
-                f"**Port:** {bot.snmp_manager.port}\n\n"
-                f"Use `/snmpconfig` to modify these settings."
+                f"📊 <b>Current SNMP Configuration</b>\n\n"
+                f"<b>Host:</b> {html.escape(self.snmp_manager.target_host)}\n"
+                f"<b>Community:</b> {html.escape(self.snmp_manager.community)}\n"
+                f"<b>Port:</b> {self.snmp_manager.port}\n\n"
+                f"Use <code>/snmpconfig</code> to modify these settings."
             )
-            await update.message.reply_text(response, parse_mode='Markdown')
-            logger.info(f"SNMP status viewed by user {update.effective_user.id}")
+            await update.message.reply_text(response, parse_mode='HTML')
+            logger.info("SNMP status viewed by user %s", update.effective_user.id)
             
         except Exception as e:
-            logger.error(f"Error in snmp_status command: {e}")
+            logger.error("Error in snmp_status command: %s", e)
             await update.message.reply_text("❌ An error occurred while retrieving status.")
     
-    @staticmethod
-    async def common_oids(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _cmd_common_oids(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /commonoids command - Show common Cisco OIDs"""
         try:
-            oids_text = (
-                "📋 **Common Cisco SNMP OIDs**\n\n"
-                "**System Information:**\n"
-                "• `1.3.6.1.2.1.1.1.0` - System description\n"
-                "• `1.3.6.1.2.1.1.3.0` - System uptime\n"
-                "• `1.3.6.1.2.1.1.5.0` - System name\n"
-                "• `1.3.6.1.2.1.1.6.0` - System location\n\n"
-                "**Interface Information:**\n"
-                "• `1.3.6.1.2.1.2.1.0` - Number of interfaces\n"
-                "• `1.3.6.1.2.1.2.2.1.2` - Interface names\n"
-                "• `1.3.6.1.2.1.2.2.1.8` - Interface status\n"
-                "• `1.3.6.1.2.1.2.2.1.10` - Interface in-octets\n"
-                "• `1.3.6.1.2.1.2.2.1.16` - Interface out-octets\n\n"
-                "**CPU & Memory:**\n"
-                "• `1.3.6.1.4.1.9.9.109.1.1.1.1.7` - CPU utilization (5min)\n"
-                "• `1.3.6.1.4.1.9.9.48.1.1.1.5` - Memory used\n"
-                "• `1.3.6.1.4.1.9.9.48.1.1.1.6` - Memory free\n\n"
-                "**Examples:**\n"
-                "`/snmp 1.3.6.1.2.1.1.1.0`\n"
-                "`/snmpwalk 1.3.6.1.2.1.2.2.1.2`"
-            )
-            await update.message.reply_text(oids_text, parse_mode='Markdown')
-            logger.info(f"Common OIDs viewed by user {update.effective_user.id}")
+            await update.message.reply_text(_COMMON_OIDS_TEXT, parse_mode='HTML')
+            logger.info("Common OIDs viewed by user %s", update.effective_user.id)
             
         except Exception as e:
-            logger.error(f"Error in common_oids command: {e}")
+            logger.error("Error in common_oids command: %s", e)
             await update.message.reply_text("❌ An error occurred while retrieving OIDs.")
 
 # Configuration
@@ -672,6 +966,15 @@ class Config:
         self.SNMP_HOST = os.getenv('SNMP_HOST', '192.168.137.130')
         self.SNMP_COMMUNITY = os.getenv('SNMP_COMMUNITY', 'public')
         self.SNMP_PORT = int(os.getenv('SNMP_PORT', '161'))
+        
+        # Telegram HTTP connection pools
+        self.CONNECTION_POOL_SIZE = int(os.getenv('CONNECTION_POOL_SIZE', '32'))
+        self.GET_UPDATES_POOL_SIZE = int(os.getenv('GET_UPDATES_POOL_SIZE', '4'))
+        
+        # Background SNMP workers
+        self.SNMP_WORKERS = int(os.getenv('SNMP_WORKERS', '8'))
+        # Seconds a successful GET result is reused; 0 disables the cache
+        self.SNMP_CACHE_TTL = float(os.getenv('SNMP_CACHE_TTL', '60'))
     
     def _parse_admin_ids(self) -> list:
         """Parse admin IDs from environment variable"""
@@ -691,31 +994,20 @@ def main():
         return
     
     # Create bot instance
-    bot = TelegramBot(config.TOKEN)
+    bot = TelegramBot(
+        config.TOKEN, config.CONNECTION_POOL_SIZE, config.GET_UPDATES_POOL_SIZE, config.SNMP_WORKERS,
+        snmp_cache_ttl=config.SNMP_CACHE_TTL
+    )
     
     # Configure SNMP with default settings
     bot.update_snmp_config(config.SNMP_HOST, config.SNMP_COMMUNITY, config.SNMP_PORT)
     
     # Register commands first
-    bot.register_command('start', CommandHandlers.start)
-    bot.register_command('help', CommandHandlers.help_command)
-    bot.register_command('echo', CommandHandlers.echo)
-    bot.register_command('info', CommandHandlers.info)
-    
-    # Register SNMP commands
-    bot.register_command('snmp', CommandHandlers.snmp_get)
-    bot.register_command('snmpwalk', CommandHandlers.snmp_walk)
-    bot.register_command('snmpconfig', CommandHandlers.snmp_config)
-    bot.register_command('snmpstatus', CommandHandlers.snmp_status)
-    bot.register_command('commonoids', CommandHandlers.common_oids)
-    
-    # Store bot instance in bot_data for access in command handlers
-    if bot.application:
-        bot.application.bot_data['bot_instance'] = bot
+    bot.register_default_commands()
     
     # Start the bot
     logger.info("Bot is starting up...")
-    logger.info(f"Default SNMP target: {config.SNMP_HOST}:{config.SNMP_PORT}")
+    logger.info("Default SNMP target: %s:%s", config.SNMP_HOST, config.SNMP_PORT)
     bot.run()
 
 if __name__ == '__main__':